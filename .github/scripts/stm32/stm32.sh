@@ -7,8 +7,16 @@
 
 source .github/scripts/init.sh
 
+# the optional second argument is a manifest file, whose modules are frozen into the firmware
+# as bytecode; this replaces the board's default manifest, so the file should start with
+# include("$(PORT_DIR)/boards/manifest.py"), and can pass opt=3 to freeze() to strip asserts
 build_stm32() {
-    make ${MAKEOPTS} -C micropython/ports/stm32 BOARD=$1 USER_C_MODULES=../../../ulab all CFLAGS_EXTRA=-DULAB_HASH_STRING=$ulab_hash
+    if [ -n "$2" ]; then
+        manifest="FROZEN_MANIFEST=$(realpath $2)"
+    else
+        manifest=""
+    fi
+    make ${MAKEOPTS} -C micropython/ports/stm32 BOARD=$1 USER_C_MODULES=../../../ulab all CFLAGS_EXTRA=-DULAB_HASH_STRING=$ulab_hash $manifest
     copy_files stm32/build-$1/firmware.dfu $1
     copy_files stm32/build-$1/firmware.hex $1
     clean_up stm32 build-$1